@@ -5,37 +5,61 @@
 - Tracks covered windows per chain epoch.
 - Optionally auto-submits on-chain billEpoch() calls to StreamAgencyEscrow.
 
-Dependency-free: Python stdlib only.
+Dependency-free: Python stdlib only. Requires Python 3.10+.
 """
 
 from __future__ import annotations
 
 import argparse
+import base64
+import functools
+import http.client
 import json
 import os
+import queue
 import random
 import re
+import shutil
+import socket
 import sqlite3
 import subprocess
 import sys
 import threading
 import time
+import urllib.request
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any
-from urllib.parse import parse_qs, urlparse
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.parse import SplitResult, parse_qs, unquote, urljoin, urlparse, urlsplit
 
 DEFAULT_DB_PATH = "stream-agency/agency.db"
 STREAM_URL = "https://stream.claws.network/stream"
 DEFAULT_API_URL = "https://api.claws.network"
 DEFAULT_CLAWPY_BIN = "clawpy"
-
-
-@dataclass
+DEFAULT_SQLITE_BUSY_TIMEOUT_MS = 5000
+STREAM_POST_WORKERS = 16
+EPOCH_CACHE_TTL_MS = 60_000
+ATTEMPTS_CURSOR_MAX = 2**63 - 1
+API_MAX_BODY_BYTES = 16 * 1024
+API_CONNECTION_TIMEOUT_S = 15
+DEFAULT_API_WORKERS = 32
+ENROLL_PROBE_WORKERS = 4
+ENROLL_PROBE_MAX_PENDING = 64
+PROBE_STATUS_MAX_ENTRIES = 1024
+BUSY_RETRY_ATTEMPTS = 5
+BUSY_RETRY_FIRST_DELAY_S = 0.05
+BUSY_RETRY_MAX_DELAY_S = 0.8
+
+_ADDRESS_RE = re.compile(r"claw1[0-9a-z]+")
+_SIGNATURE_RE = re.compile(r"0x[0-9a-fA-F]+")
+
+
+@dataclass(slots=True, frozen=True)
 class Config:
     lead_seconds: int
     jitter_seconds: int
@@ -49,8 +73,10 @@ class Config:
     billing_chain: str
     billing_gas_limit: int
     billing_gas_price: int
+    billing_workers: int
     epoch_api_url: str
     intake_probe_stream: bool
+    sqlite_busy_timeout_ms: int
 
 
 def now_ms() -> int:
@@ -63,14 +89,121 @@ def fmt_ts(epoch_ms: int | None) -> str:
     return datetime.fromtimestamp(epoch_ms / 1000.0, tz=timezone.utc).isoformat()
 
 
-def connect_db(db_path: str) -> sqlite3.Connection:
-    conn = sqlite3.connect(db_path, timeout=30)
+def connect_db(
+    db_path: str,
+    busy_timeout_ms: int = DEFAULT_SQLITE_BUSY_TIMEOUT_MS,
+    check_same_thread: bool = True,
+) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        db_path,
+        timeout=busy_timeout_ms / 1000.0,
+        check_same_thread=check_same_thread,
+        cached_statements=256,
+    )
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode = WAL;")
+    # NORMAL is durable across application crashes in WAL mode and skips the
+    # per-commit fsync of the WAL file.
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)};")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA mmap_size = 268435456;")
     conn.execute("PRAGMA foreign_keys = ON;")
     return conn
 
 
+def close_db(conn: sqlite3.Connection) -> None:
+    # Let SQLite refresh planner statistics the session's queries would benefit from.
+    try:
+        conn.execute("PRAGMA analysis_limit = 1000;")
+        conn.execute("PRAGMA optimize;")
+    except sqlite3.Error:
+        pass
+    conn.close()
+
+
+def _with_busy_retry(fn: Any, *args: Any, **kwargs: Any) -> Any:
+    # busy_timeout covers short waits; once it elapses, back off with jitter
+    # (50-100ms, doubling to 800ms) so colliding writers do not retry in step.
+    delay = BUSY_RETRY_FIRST_DELAY_S
+    for attempt in range(1, BUSY_RETRY_ATTEMPTS + 1):
+        try:
+            return fn(*args, **kwargs)
+        except sqlite3.OperationalError as exc:
+            if attempt == BUSY_RETRY_ATTEMPTS or "database is locked" not in str(exc):
+                raise
+        time.sleep(random.uniform(delay, min(delay * 2, BUSY_RETRY_MAX_DELAY_S)))
+        delay *= 2
+
+
+@contextmanager
+def open_db(db_path: str, busy_timeout_ms: int = DEFAULT_SQLITE_BUSY_TIMEOUT_MS) -> Iterator[sqlite3.Connection]:
+    conn = connect_db(db_path, busy_timeout_ms)
+    try:
+        with conn:
+            yield conn
+    finally:
+        close_db(conn)
+
+
+class ConnectionPool:
+    """One serialized writer plus pre-opened read-only connections for the API.
+
+    Inline tick cycles get a connection of their own: they spend most of their
+    time on stream POSTs and billEpoch sends, and must not hold the writer the
+    short intake mutations queue on.
+    """
+
+    def __init__(self, db_path: str, readers: int, busy_timeout_ms: int) -> None:
+        self._writer = connect_db(db_path, busy_timeout_ms, check_same_thread=False)
+        self._writer_lock = threading.Lock()
+        self._ticker = connect_db(db_path, busy_timeout_ms, check_same_thread=False)
+        self._ticker_lock = threading.Lock()
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        for _ in range(readers):
+            conn = connect_db(db_path, busy_timeout_ms, check_same_thread=False)
+            conn.execute("PRAGMA query_only = 1;")
+            self._readers.put(conn)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        with self._writer_lock, self._writer:
+            yield self._writer
+
+    @contextmanager
+    def ticker(self) -> Iterator[sqlite3.Connection]:
+        with self._ticker_lock:
+            yield self._ticker
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        # WAL lets these read alongside the writer's open transaction.
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def close(self) -> None:
+        with self._writer_lock:
+            close_db(self._writer)
+        # An inline tick may still be running on a daemon API worker; wait a
+        # little for it, then leave its connection to process exit.
+        if self._ticker_lock.acquire(timeout=3):
+            try:
+                close_db(self._ticker)
+            finally:
+                self._ticker_lock.release()
+        # Readers still checked out by daemon API workers mid-request are left
+        # to process exit.
+        while True:
+            try:
+                conn = self._readers.get_nowait()
+            except queue.Empty:
+                return
+            close_db(conn)
+
+
 def init_db(conn: sqlite3.Connection) -> None:
     conn.executescript(
         """
@@ -128,17 +261,20 @@ def init_db(conn: sqlite3.Connection) -> None:
             FOREIGN KEY(agent_id) REFERENCES agents(id)
         );
 
-        CREATE INDEX IF NOT EXISTS idx_agents_next_attempt
-            ON agents(status, next_attempt_ms);
+        DROP INDEX IF EXISTS idx_agents_next_attempt;
+        CREATE INDEX IF NOT EXISTS idx_agents_due
+            ON agents(COALESCE(next_attempt_ms, 0)) WHERE status = 'active';
         CREATE INDEX IF NOT EXISTS idx_attempts_agent_time
             ON attempts(agent_id, attempted_ms DESC);
-        CREATE INDEX IF NOT EXISTS idx_usage_epoch
-            ON usage_windows(epoch, billed);
+        DROP INDEX IF EXISTS idx_usage_epoch;
+        CREATE INDEX IF NOT EXISTS idx_usage_billed_epoch
+            ON usage_windows(billed, epoch, agent_id, windows);
         """
     )
     conn.commit()
 
 
+@functools.lru_cache(maxsize=8192)
 def _normalize_signature(sig: str) -> str:
     s = sig.strip()
     if s.startswith("0x"):
@@ -146,13 +282,20 @@ def _normalize_signature(sig: str) -> str:
     return s
 
 
-def _run_clawpy(args: list[str]) -> str:
+@functools.lru_cache(maxsize=None)
+def _clawpy_bin() -> str:
     clawpy_bin = os.environ.get("CLAWPY_BIN", DEFAULT_CLAWPY_BIN).strip() or DEFAULT_CLAWPY_BIN
+    # Resolve the PATH lookup once so each spawn execs an absolute path.
+    return shutil.which(clawpy_bin) or clawpy_bin
+
+
+def _run_clawpy(args: list[str]) -> str:
     proc = subprocess.run(
-        [clawpy_bin, *args],
+        [_clawpy_bin(), *args],
         check=False,
         capture_output=True,
         text=True,
+        close_fds=False,
     )
     if proc.returncode != 0:
         raise RuntimeError(
@@ -164,17 +307,17 @@ def _run_clawpy(args: list[str]) -> str:
 
 
 def _extract_address(text: str) -> str:
-    match = re.search(r"(claw1[0-9a-z]+)", text)
+    match = _ADDRESS_RE.search(text)
     if not match:
         raise RuntimeError(f"Unable to parse claw address from output:\n{text}")
-    return match.group(1)
+    return match.group(0)
 
 
 def _extract_signature(text: str) -> str:
-    match = re.search(r"(0x[0-9a-fA-F]+)", text)
+    match = _SIGNATURE_RE.search(text)
     if not match:
         raise RuntimeError(f"Unable to parse signature from output:\n{text}")
-    return match.group(1)
+    return match.group(0)
 
 
 def enroll_from_pem(conn: sqlite3.Connection, pem: str, fee_bps: int) -> str:
@@ -255,45 +398,203 @@ def list_agents(conn: sqlite3.Connection) -> list[sqlite3.Row]:
     )
 
 
-def _post_stream(stream_url: str, address: str, signature: str) -> tuple[bool, int, str, dict[str, Any] | None]:
+class _HttpPool:
+    """Keep-alive HTTP(S) connections shared by stream worker threads.
+
+    Mirrors what urlopen's default opener did for us: proxies come from the
+    environment (http_proxy/https_proxy/no_proxy) and redirects are followed
+    under the same rules as urllib's HTTPRedirectHandler.
+    """
+
+    _REDIRECT_CODES = (301, 302, 303, 307, 308)
+    _MAX_REDIRECTS = 10
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._idle: dict[tuple[str, str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _proxy_for(parts: SplitResult) -> str:
+        proxy = urllib.request.getproxies().get(parts.scheme, "")
+        if proxy and urllib.request.proxy_bypass(parts.hostname or ""):
+            return ""
+        return proxy
+
+    @staticmethod
+    def _proxy_auth(proxy: str) -> dict[str, str]:
+        p = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+        if p.username is None:
+            return {}
+        creds = f"{unquote(p.username)}:{unquote(p.password or '')}".encode("utf-8")
+        return {"Proxy-Authorization": "Basic " + base64.b64encode(creds).decode("ascii")}
+
+    def _connect(self, key: tuple[str, str, str], timeout: float) -> http.client.HTTPConnection:
+        scheme, netloc, proxy = key
+        if scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {scheme}")
+        if not proxy:
+            if scheme == "https":
+                return http.client.HTTPSConnection(netloc, timeout=timeout)
+            return http.client.HTTPConnection(netloc, timeout=timeout)
+
+        proxy_host = urlsplit(proxy if "://" in proxy else f"http://{proxy}").netloc.rpartition("@")[2]
+        if scheme == "https":
+            # TLS to the origin inside a CONNECT tunnel through the proxy.
+            conn: http.client.HTTPConnection = http.client.HTTPSConnection(proxy_host, timeout=timeout)
+            conn.set_tunnel(netloc, headers=self._proxy_auth(proxy))
+            return conn
+        return http.client.HTTPConnection(proxy_host, timeout=timeout)
+
+    def _acquire(self, key: tuple[str, str, str], timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                conn = idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        return self._connect(key, timeout), False
+
+    def _release(self, key: tuple[str, str, str], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._maxsize:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, str | None, bytes]:
+        parts = urlsplit(url)
+        proxy = self._proxy_for(parts)
+        key = (parts.scheme, parts.netloc, proxy)
+        if proxy and parts.scheme == "http":
+            # Plain HTTP through a proxy sends the absolute URL to the proxy.
+            target = url
+            headers = {**headers, **self._proxy_auth(proxy)}
+        else:
+            target = parts.path or "/"
+            if parts.query:
+                target = f"{target}?{parts.query}"
+
+        while True:
+            conn, reused = self._acquire(key, timeout)
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                conn.close()
+                # The server dropped an idle keep-alive connection; retry on a fresh one.
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(key, conn)
+            return resp.status, resp.getheader("Location"), data
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float = 20,
+    ) -> tuple[int, bytes]:
+        headers = headers or {}
+        for _ in range(self._MAX_REDIRECTS + 1):
+            status, location, data = self._send(method, url, body, headers, timeout)
+            follow = status in self._REDIRECT_CODES and (
+                method in ("GET", "HEAD") or (method == "POST" and status in (301, 302, 303))
+            )
+            if not follow or not location:
+                return status, data
+            url = urljoin(url, location)
+            if method == "POST":
+                # As urllib does: the redirected request is a GET without the body.
+                method, body = "GET", None
+                headers = {k: v for k, v in headers.items() if k.lower() not in ("content-type", "content-length")}
+        raise http.client.HTTPException(f"Too many redirects, last Location: {url}")
+
+
+_HTTP = _HttpPool(maxsize=32)
+
+
+@functools.lru_cache(maxsize=8192)
+def _stream_body(address: str, signature: str) -> bytes:
+    # The payload only depends on the agent, so it is encoded once and
+    # reused on every renewal.
     payload = {
         "signature": _normalize_signature(signature),
         "message": "stream",
         "address": address,
     }
-    req = Request(
-        stream_url,
-        method="POST",
-        data=json.dumps(payload).encode("utf-8"),
-        headers={"Content-Type": "application/json"},
-    )
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
 
+def _post_stream(stream_url: str, address: str, signature: str) -> tuple[bool, int, bytes, dict[str, Any] | None]:
     try:
-        with urlopen(req, timeout=20) as resp:
-            body = resp.read().decode("utf-8", errors="replace")
-            parsed = json.loads(body) if body else None
-            return True, resp.status, body, parsed
-    except HTTPError as e:
-        body = e.read().decode("utf-8", errors="replace") if e.fp else str(e)
-        parsed = None
+        status, raw = _HTTP.request(
+            "POST",
+            stream_url,
+            body=_stream_body(address, signature),
+            headers={"Content-Type": "application/json"},
+            timeout=20,
+        )
+    except (OSError, ValueError, http.client.HTTPException) as e:
+        return False, 0, f"URLError: {e}".encode("utf-8"), None
+
+    ok = 200 <= status < 300
+    parsed = None
+    if raw:
+        # json.loads parses bytes directly; ValueError also covers non-UTF-8 bodies.
         try:
-            parsed = json.loads(body)
-        except json.JSONDecodeError:
+            parsed = json.loads(raw)
+        except ValueError:
+            if ok:
+                raise
             parsed = None
-        return False, e.code, body, parsed
-    except URLError as e:
-        return False, 0, f"URLError: {e}", None
+    return ok, status, raw, parsed
 
 
 def _get_json(url: str) -> dict[str, Any]:
-    req = Request(url, method="GET")
-    with urlopen(req, timeout=20) as resp:
-        body = resp.read().decode("utf-8", errors="replace")
-        return json.loads(body)
+    # Goes through the keep-alive pool so per-tick epoch polls reuse one
+    # connection; the pool applies the proxy environment and follows redirects
+    # like urlopen did, so only a final non-2xx is an error.
+    status, raw = _HTTP.request("GET", url, headers={"Accept": "application/json"}, timeout=20)
+    if not 200 <= status < 300:
+        raise RuntimeError(f"HTTP {status} from {url}")
+    return json.loads(raw)
+
+
+_EPOCH_CACHE: dict[str, tuple[int, int]] = {}
 
 
 def get_chain_epoch(api_base: str) -> int:
     base = api_base.rstrip("/")
+    cached = _EPOCH_CACHE.get(base)
+    if cached is not None and now_ms() - cached[1] < EPOCH_CACHE_TTL_MS:
+        return cached[0]
+
+    epoch = _fetch_chain_epoch(base)
+    _EPOCH_CACHE[base] = (epoch, now_ms())
+    return epoch
+
+
+def _fetch_chain_epoch(base: str) -> int:
     last_error: Exception | None = None
     data = None
     for path in ("/network/status/4294967295", "/network/status"):
@@ -320,6 +621,29 @@ def get_chain_epoch(api_base: str) -> int:
     raise RuntimeError(f"Unable to parse chain epoch from /network/status response: {data}")
 
 
+def _decode_body(body: bytes, limit: int) -> str:
+    return body[:limit].decode("utf-8", errors="replace")
+
+
+_ALREADY_STREAMING = b"already streaming"
+
+
+def _stream_reason(ok: bool, status_code: int, body: bytes) -> str:
+    if ok:
+        return "ok"
+    if status_code == 403 and _ALREADY_STREAMING in body.lower():
+        return "already_streaming"
+    return "error"
+
+
+# (reason, has end_stream) -> stats key. A live stream window, fresh or
+# already running, counts as covered; everything else is retried.
+_STREAM_OUTCOMES = {
+    ("ok", True): "ok",
+    ("already_streaming", True): "ok",
+}
+
+
 def _extract_end_stream_ms(parsed: dict[str, Any] | None) -> int | None:
     if not parsed:
         return None
@@ -327,41 +651,56 @@ def _extract_end_stream_ms(parsed: dict[str, Any] | None) -> int | None:
     return value if isinstance(value, int) else None
 
 
-def _record_attempt(
-    conn: sqlite3.Connection,
-    agent_id: int,
-    ok: bool,
-    status_code: int,
-    reason: str,
-    end_stream_ms: int | None,
-    response_body: str,
-) -> None:
-    conn.execute(
-        """
-        INSERT INTO attempts(agent_id, attempted_ms, ok, status_code, reason, end_stream_ms, response_body)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            agent_id,
-            now_ms(),
-            1 if ok else 0,
-            status_code,
-            reason,
-            end_stream_ms,
-            response_body[:4000],
-        ),
-    )
+_DUE_AGENTS_SQL = """
+    SELECT id, address, stream_signature, fee_bps, retry_step FROM agents
+    WHERE status = 'active'
+      AND COALESCE(next_attempt_ms, 0) <= ?
+    ORDER BY COALESCE(next_attempt_ms, 0) ASC
+"""
 
+_INSERT_ATTEMPT_SQL = """
+    INSERT INTO attempts(agent_id, attempted_ms, ok, status_code, reason, end_stream_ms, response_body)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
 
-def _increment_usage_window(conn: sqlite3.Connection, agent_id: int, epoch: int) -> None:
-    conn.execute(
-        """
-        INSERT INTO usage_windows(agent_id, epoch, windows, billed)
-        VALUES (?, ?, 1, 0)
-        ON CONFLICT(agent_id, epoch) DO UPDATE SET windows = windows + 1
-        """,
-        (agent_id, epoch),
-    )
+_RENEW_AGENT_SQL = """
+    UPDATE agents
+    SET
+        expected_end_ms = ?,
+        next_attempt_ms = ?,
+        retry_step = 0,
+        success_count = success_count + 1,
+        fee_due_claw = fee_due_claw + ?,
+        last_success_ms = ?,
+        last_error = NULL,
+        updated_ms = ?
+    WHERE id = ?
+"""
+
+_RETRY_AGENT_SQL = """
+    UPDATE agents
+    SET
+        next_attempt_ms = ?,
+        retry_step = ?,
+        failure_count = failure_count + 1,
+        last_error = ?,
+        updated_ms = ?
+    WHERE id = ?
+"""
+
+_UPSERT_USAGE_WINDOW_SQL = """
+    INSERT INTO usage_windows(agent_id, epoch, windows, billed)
+    VALUES (?, ?, ?, 0)
+    ON CONFLICT(agent_id, epoch) DO UPDATE SET windows = windows + excluded.windows
+"""
+
+
+def _record_attempts(conn: sqlite3.Connection, rows: list[tuple[Any, ...]]) -> None:
+    conn.executemany(_INSERT_ATTEMPT_SQL, rows)
+
+
+def _increment_usage_windows(conn: sqlite3.Connection, increments: dict[int, int], epoch: int) -> None:
+    conn.executemany(_UPSERT_USAGE_WINDOW_SQL, [(aid, epoch, count) for aid, count in increments.items()])
 
 
 def _next_planned_attempt(end_stream_ms: int, lead_seconds: int, jitter_seconds: int) -> int:
@@ -382,114 +721,86 @@ def _schedule_retry(ts_ms: int, retry_step: int) -> tuple[int, int]:
 
 def process_due_agents(conn: sqlite3.Connection, cfg: Config, chain_epoch: int | None) -> dict[str, int]:
     ts_ms = now_ms()
-    due_agents = list(
-        conn.execute(
-            """
-            SELECT * FROM agents
-            WHERE status = 'active'
-              AND (next_attempt_ms IS NULL OR next_attempt_ms <= ?)
-            ORDER BY COALESCE(next_attempt_ms, 0) ASC
-            """,
-            (ts_ms,),
-        )
-    )
+    due_agents = [
+        (int(aid), str(address), str(sig), int(fee_bps), int(retry_step))
+        for aid, address, sig, fee_bps, retry_step in conn.execute(_DUE_AGENTS_SQL, (ts_ms,))
+    ]
 
     stats = {"processed": 0, "ok": 0, "fail": 0, "usage_windows_added": 0}
+    if not due_agents:
+        return stats
 
-    for agent in due_agents:
-        stats["processed"] += 1
-        aid = int(agent["id"])
-        address = str(agent["address"])
-        sig = str(agent["stream_signature"])
-        fee_bps = int(agent["fee_bps"])
-        retry_step = int(agent["retry_step"])
+    # Stream POSTs are network-bound and independent per agent; fan them out
+    # and apply the results on this thread.
+    with ThreadPoolExecutor(max_workers=min(len(due_agents), STREAM_POST_WORKERS)) as executor:
+        responses = list(
+            executor.map(
+                lambda agent: _post_stream(cfg.stream_url, agent[1], agent[2]),
+                due_agents,
+            )
+        )
+
+    # Collect per-outcome rows, then flush them in one short write
+    # transaction instead of one statement per agent.
+    attempt_rows: list[tuple[Any, ...]] = []
+    renewed_rows: list[tuple[Any, ...]] = []
+    retry_rows: list[tuple[Any, ...]] = []
+    usage_increments: dict[int, int] = {}
 
-        ok, status_code, body, parsed = _post_stream(cfg.stream_url, address, sig)
+    for (aid, _, _, fee_bps, retry_step), (ok, status_code, body, parsed) in zip(due_agents, responses):
+        stats["processed"] += 1
         end_stream_ms = _extract_end_stream_ms(parsed)
 
-        reason = "ok" if ok else "error"
-        if not ok and status_code == 403 and "already streaming" in body.lower():
-            reason = "already_streaming"
+        reason = _stream_reason(ok, status_code, body)
+        outcome = _STREAM_OUTCOMES.get((reason, bool(end_stream_ms)), "fail")
+        stats[outcome] += 1
 
-        _record_attempt(conn, aid, ok, status_code, reason, end_stream_ms, body)
+        attempt_rows.append(
+            (aid, now_ms(), 1 if ok else 0, status_code, reason, end_stream_ms, _decode_body(body, 4000))
+        )
 
-        if ok and end_stream_ms:
+        if outcome == "ok":
             fee = _fee_for_success(cfg.reward_per_window, fee_bps)
             next_attempt = _next_planned_attempt(end_stream_ms, cfg.lead_seconds, cfg.jitter_seconds)
-            conn.execute(
-                """
-                UPDATE agents
-                SET
-                    expected_end_ms = ?,
-                    next_attempt_ms = ?,
-                    retry_step = 0,
-                    success_count = success_count + 1,
-                    fee_due_claw = fee_due_claw + ?,
-                    last_success_ms = ?,
-                    last_error = NULL,
-                    updated_ms = ?
-                WHERE id = ?
-                """,
-                (end_stream_ms, next_attempt, fee, ts_ms, ts_ms, aid),
-            )
-            if chain_epoch is not None:
-                _increment_usage_window(conn, aid, chain_epoch)
-                stats["usage_windows_added"] += 1
-            stats["ok"] += 1
-            continue
-
-        if reason == "already_streaming" and end_stream_ms:
-            next_attempt = _next_planned_attempt(end_stream_ms, cfg.lead_seconds, cfg.jitter_seconds)
-            fee = _fee_for_success(cfg.reward_per_window, fee_bps)
-            conn.execute(
-                """
-                UPDATE agents
-                SET
-                    expected_end_ms = ?,
-                    next_attempt_ms = ?,
-                    retry_step = 0,
-                    success_count = success_count + 1,
-                    fee_due_claw = fee_due_claw + ?,
-                    last_success_ms = ?,
-                    last_error = NULL,
-                    updated_ms = ?
-                WHERE id = ?
-                """,
-                (end_stream_ms, next_attempt, fee, ts_ms, ts_ms, aid),
-            )
+            renewed_rows.append((end_stream_ms, next_attempt, fee, ts_ms, ts_ms, aid))
             if chain_epoch is not None:
-                _increment_usage_window(conn, aid, chain_epoch)
+                usage_increments[aid] = usage_increments.get(aid, 0) + 1
                 stats["usage_windows_added"] += 1
-            stats["ok"] += 1
             continue
 
         retry_at, next_retry_step = _schedule_retry(ts_ms, retry_step)
-        conn.execute(
-            """
-            UPDATE agents
-            SET
-                next_attempt_ms = ?,
-                retry_step = ?,
-                failure_count = failure_count + 1,
-                last_error = ?,
-                updated_ms = ?
-            WHERE id = ?
-            """,
-            (retry_at, next_retry_step, f"{status_code}: {body[:300]}", ts_ms, aid),
-        )
-        stats["fail"] += 1
+        retry_rows.append((retry_at, next_retry_step, f"{status_code}: {_decode_body(body, 300)}", ts_ms, aid))
 
-    conn.commit()
+    # Only the local bookkeeping is retried; the stream POSTs above are not replayed.
+    _with_busy_retry(
+        _flush_stream_results, conn, attempt_rows, renewed_rows, retry_rows, usage_increments, chain_epoch
+    )
     return stats
 
 
-def _run_bill_epoch(cfg: Config, agent_address: str, epoch: int, windows: int) -> subprocess.CompletedProcess:
+def _flush_stream_results(
+    conn: sqlite3.Connection,
+    attempt_rows: list[tuple[Any, ...]],
+    renewed_rows: list[tuple[Any, ...]],
+    retry_rows: list[tuple[Any, ...]],
+    usage_increments: dict[int, int],
+    chain_epoch: int | None,
+) -> None:
+    conn.execute("BEGIN IMMEDIATE")
+    with conn:
+        _record_attempts(conn, attempt_rows)
+        conn.executemany(_RENEW_AGENT_SQL, renewed_rows)
+        conn.executemany(_RETRY_AGENT_SQL, retry_rows)
+        if chain_epoch is not None and usage_increments:
+            _increment_usage_windows(conn, usage_increments, chain_epoch)
+
+
+def _run_bill_epoch(cfg: Config, agent_address: str, epoch: int, windows: int) -> subprocess.CompletedProcess[bytes]:
     if not cfg.escrow_contract or not cfg.operator_pem:
         raise RuntimeError("Billing requires --escrow-contract and --operator-pem")
 
-    clawpy_bin = os.environ.get("CLAWPY_BIN", DEFAULT_CLAWPY_BIN).strip() or DEFAULT_CLAWPY_BIN
     cmd = [
-        clawpy_bin,
+        _clawpy_bin(),
         "contract",
         "call",
         cfg.escrow_contract,
@@ -511,7 +822,39 @@ def _run_bill_epoch(cfg: Config, agent_address: str, epoch: int, windows: int) -
         cfg.billing_proxy,
         "--send",
     ]
-    return subprocess.run(cmd, capture_output=True, text=True)
+    # Our own descriptors are non-inheritable (PEP 446), so close_fds=False
+    # is safe and lets CPython spawn via posix_spawn instead of fork+exec.
+    # Output stays bytes; callers decode only the slices they keep.
+    return subprocess.run(cmd, capture_output=True, close_fds=False)
+
+
+_BILLING_CANDIDATES_SQL = """
+    SELECT uw.agent_id, uw.epoch, uw.windows, a.address
+    FROM usage_windows uw INDEXED BY idx_usage_billed_epoch
+    JOIN agents a ON a.id = uw.agent_id
+    WHERE uw.billed = 0
+      AND uw.epoch < ?
+      AND uw.windows > 0
+      AND a.status IN ('active', 'paused', 'suspended')
+    ORDER BY uw.epoch ASC, uw.agent_id ASC
+"""
+
+_INSERT_BILLING_ATTEMPT_SQL = """
+    INSERT INTO billing_attempts(agent_id, epoch, windows, attempted_ms, ok, return_code, stdout, stderr)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_MARK_BILLED_SQL = """
+    UPDATE usage_windows
+    SET billed = 1, billed_at_ms = ?, last_error = NULL
+    WHERE agent_id = ? AND epoch = ?
+"""
+
+_MARK_BILL_FAILED_SQL = """
+    UPDATE usage_windows
+    SET last_error = ?
+    WHERE agent_id = ? AND epoch = ?
+"""
 
 
 def bill_closed_epochs(conn: sqlite3.Connection, cfg: Config, chain_epoch: int | None) -> dict[str, int]:
@@ -519,75 +862,96 @@ def bill_closed_epochs(conn: sqlite3.Connection, cfg: Config, chain_epoch: int |
     if not cfg.billing_enabled or chain_epoch is None:
         return stats
 
-    candidates = list(
-        conn.execute(
-            """
-            SELECT uw.agent_id, uw.epoch, uw.windows, a.address
-            FROM usage_windows uw
-            JOIN agents a ON a.id = uw.agent_id
-            WHERE uw.billed = 0
-              AND uw.epoch < ?
-              AND uw.windows > 0
-              AND a.status IN ('active', 'paused', 'suspended')
-            ORDER BY uw.epoch ASC, uw.agent_id ASC
-            """,
-            (chain_epoch,),
-        )
-    )
+    candidates = list(conn.execute(_BILLING_CANDIDATES_SQL, (chain_epoch,)))
 
     stats["billing_candidates"] = len(candidates)
+    if not candidates:
+        return stats
 
-    for row in candidates:
-        agent_id = int(row["agent_id"])
-        epoch = int(row["epoch"])
-        windows = int(row["windows"])
-        address = str(row["address"])
-
-        proc = _run_bill_epoch(cfg, address, epoch, windows)
-        ok = proc.returncode == 0
+    attempt_rows: list[tuple[Any, ...]] = []
+    billed_rows: list[tuple[Any, ...]] = []
+    failed_rows: list[tuple[Any, ...]] = []
 
-        conn.execute(
-            """
-            INSERT INTO billing_attempts(agent_id, epoch, windows, attempted_ms, ok, return_code, stdout, stderr)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                agent_id,
-                epoch,
-                windows,
-                now_ms(),
-                1 if ok else 0,
-                proc.returncode,
-                (proc.stdout or "")[:4000],
-                (proc.stderr or "")[:4000],
-            ),
-        )
+    # Each billEpoch call is an on-chain send; record whatever was submitted
+    # even if another candidate raises.
+    error: Exception | None = None
+    try:
+        with ThreadPoolExecutor(max_workers=cfg.billing_workers) as executor:
+            futures = {
+                executor.submit(
+                    _run_bill_epoch, cfg, str(row["address"]), int(row["epoch"]), int(row["windows"])
+                ): (int(row["agent_id"]), int(row["epoch"]), int(row["windows"]))
+                for row in candidates
+            }
+            for fut in as_completed(futures):
+                agent_id, epoch, windows = futures[fut]
+                try:
+                    proc = fut.result()
+                except Exception as exc:
+                    if error is None:
+                        error = exc
+                        for pending in futures:
+                            pending.cancel()
+                    continue
+
+                ok = proc.returncode == 0
+                stdout = proc.stdout[:4000].decode("utf-8", errors="replace")
+                stderr = proc.stderr[:4000].decode("utf-8", errors="replace")
+
+                attempt_rows.append(
+                    (
+                        agent_id,
+                        epoch,
+                        windows,
+                        now_ms(),
+                        1 if ok else 0,
+                        proc.returncode,
+                        stdout,
+                        stderr,
+                    )
+                )
 
-        if ok:
-            conn.execute(
-                """
-                UPDATE usage_windows
-                SET billed = 1, billed_at_ms = ?, last_error = NULL
-                WHERE agent_id = ? AND epoch = ?
-                """,
-                (now_ms(), agent_id, epoch),
-            )
-            stats["billing_ok"] += 1
-        else:
-            conn.execute(
-                """
-                UPDATE usage_windows
-                SET last_error = ?
-                WHERE agent_id = ? AND epoch = ?
-                """,
-                ((proc.stderr or proc.stdout or "billing failed")[:300], agent_id, epoch),
+                if ok:
+                    billed_rows.append((now_ms(), agent_id, epoch))
+                    stats["billing_ok"] += 1
+                else:
+                    failed_rows.append(((stderr or stdout or "billing failed")[:300], agent_id, epoch))
+                    stats["billing_fail"] += 1
+    finally:
+        # Losing these rows would re-bill epochs already settled on chain, so
+        # retry the flush rather than the billEpoch calls.
+        try:
+            _with_busy_retry(_flush_billing_results, conn, attempt_rows, billed_rows, failed_rows)
+        except Exception as flush_exc:
+            # Leave a trail of what was sent so an operator can mark it billed by hand.
+            ts = datetime.now(tz=timezone.utc).isoformat()
+            lines = [f"{ts} billing-flush-error: {flush_exc}; {len(attempt_rows)} attempt(s) not recorded\n"]
+            lines.extend(
+                f"{ts} billing-unrecorded agent_id={agent_id} epoch={epoch} billed_on_chain=1\n"
+                for _, agent_id, epoch in billed_rows
             )
-            stats["billing_fail"] += 1
-
-    conn.commit()
+            sys.stderr.write("".join(lines))
+            if error is not None:
+                raise flush_exc from error
+            raise
+    if error is not None:
+        raise error
     return stats
 
 
+def _flush_billing_results(
+    conn: sqlite3.Connection,
+    attempt_rows: list[tuple[Any, ...]],
+    billed_rows: list[tuple[Any, ...]],
+    failed_rows: list[tuple[Any, ...]],
+) -> None:
+    conn.execute("BEGIN IMMEDIATE")
+    with conn:
+        conn.executemany(_INSERT_BILLING_ATTEMPT_SQL, attempt_rows)
+        conn.executemany(_MARK_BILLED_SQL, billed_rows)
+        conn.executemany(_MARK_BILL_FAILED_SQL, failed_rows)
+
+
 def execute_tick(conn: sqlite3.Connection, cfg: Config) -> dict[str, Any]:
     chain_epoch = None
     epoch_error = None
@@ -607,64 +971,64 @@ def execute_tick(conn: sqlite3.Connection, cfg: Config) -> dict[str, Any]:
     }
 
 
-def collect_report_data(conn: sqlite3.Connection) -> list[dict[str, Any]]:
-    usage = {
-        int(r["agent_id"]): (int(r["pending"] or 0), int(r["billed"] or 0))
-        for r in conn.execute(
-            """
-            SELECT
-                agent_id,
-                SUM(CASE WHEN billed = 0 THEN windows ELSE 0 END) AS pending,
-                SUM(CASE WHEN billed = 1 THEN windows ELSE 0 END) AS billed
-            FROM usage_windows
-            GROUP BY agent_id
-            """
-        )
-    }
+_REPORT_SQL = """
+    SELECT
+        a.id, a.address, a.fee_bps, a.status,
+        a.success_count, a.failure_count,
+        a.next_attempt_ms, a.expected_end_ms,
+        a.last_success_ms, a.last_error,
+        COALESCE(SUM(CASE WHEN uw.billed = 0 THEN uw.windows END), 0) AS pending,
+        COALESCE(SUM(CASE WHEN uw.billed = 1 THEN uw.windows END), 0) AS billed
+    FROM agents a
+    LEFT JOIN usage_windows uw ON uw.agent_id = a.id
+    GROUP BY a.id
+    ORDER BY a.id
+"""
 
-    rows = []
-    for row in list_agents(conn):
-        pending, billed = usage.get(int(row["id"]), (0, 0))
-        rows.append(
-            {
-                "id": int(row["id"]),
-                "address": str(row["address"]),
-                "fee_bps": int(row["fee_bps"]),
-                "status": str(row["status"]),
-                "success_count": int(row["success_count"]),
-                "failure_count": int(row["failure_count"]),
-                "pending_windows": pending,
-                "billed_windows": billed,
-                "next_attempt_ms": row["next_attempt_ms"],
-                "expected_end_ms": row["expected_end_ms"],
-                "last_success_ms": row["last_success_ms"],
-                "last_error": row["last_error"],
-            }
-        )
-    return rows
+
+def collect_report_data(conn: sqlite3.Connection) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": int(row["id"]),
+            "address": str(row["address"]),
+            "fee_bps": int(row["fee_bps"]),
+            "status": str(row["status"]),
+            "success_count": int(row["success_count"]),
+            "failure_count": int(row["failure_count"]),
+            "pending_windows": int(row["pending"]),
+            "billed_windows": int(row["billed"]),
+            "next_attempt_ms": row["next_attempt_ms"],
+            "expected_end_ms": row["expected_end_ms"],
+            "last_success_ms": row["last_success_ms"],
+            "last_error": row["last_error"],
+        }
+        for row in conn.execute(_REPORT_SQL)
+    ]
 
 
 def print_report(conn: sqlite3.Connection) -> None:
-    rows = collect_report_data(conn)
+    cur = conn.cursor()
+    cur.row_factory = None
+    rows = cur.execute(_REPORT_SQL).fetchall()
     if not rows:
         print("No agents enrolled.")
         return
 
-    print(
-        "address                              status  fee_bps  ok/fail  pending/billed  next_attempt(UTC)                 expected_end(UTC)"
-    )
-    print("-" * 146)
-    for row in rows:
-        addr = row["address"]
+    lines = [
+        "address                              status  fee_bps  ok/fail  pending/billed  next_attempt(UTC)                 expected_end(UTC)",
+        "-" * 146,
+    ]
+    for _, addr, fee_bps, status, ok_count, fail_count, next_attempt_ms, expected_end_ms, _, _, pending, billed in rows:
         if len(addr) > 34:
             addr = addr[:31] + "..."
-        print(
-            f"{addr:<34} {row['status']:<9} {row['fee_bps']:<7} "
-            f"{row['success_count']}/{row['failure_count']:<7} "
-            f"{row['pending_windows']}/{row['billed_windows']:<13} "
-            f"{fmt_ts(row['next_attempt_ms']):<32} "
-            f"{fmt_ts(row['expected_end_ms']):<32}"
+        lines.append(
+            f"{addr:<34} {status:<9} {fee_bps:<7} "
+            f"{ok_count}/{fail_count:<7} "
+            f"{pending}/{billed:<13} "
+            f"{fmt_ts(next_attempt_ms):<32} "
+            f"{fmt_ts(expected_end_ms):<32}"
         )
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_attempts(conn: sqlite3.Connection, address: str, limit: int) -> None:
@@ -737,28 +1101,37 @@ def _is_authorized(handler: BaseHTTPRequestHandler, token: str | None) -> bool:
     return api_key == token
 
 
-def _read_json_body(handler: BaseHTTPRequestHandler) -> dict[str, Any]:
+def _content_length(handler: BaseHTTPRequestHandler) -> int:
     length_raw = handler.headers.get("Content-Length", "0")
     try:
-        length = int(length_raw)
+        return int(length_raw)
     except ValueError as exc:
         raise RuntimeError(f"Invalid Content-Length: {length_raw}") from exc
+
+
+def _read_json_body(handler: BaseHTTPRequestHandler, length: int) -> dict[str, Any]:
     if length <= 0:
         return {}
     raw = handler.rfile.read(length)
     if not raw:
         return {}
     try:
-        parsed = json.loads(raw.decode("utf-8"))
-    except json.JSONDecodeError as exc:
+        parsed = json.loads(raw)
+    except ValueError as exc:
         raise RuntimeError("Body must be valid JSON") from exc
     if not isinstance(parsed, dict):
         raise RuntimeError("JSON payload must be an object")
     return parsed
 
 
+_JSON_ENCODE = json.JSONEncoder(separators=(",", ":")).encode
+
+
 def _write_json(handler: BaseHTTPRequestHandler, status: int, payload: dict[str, Any]) -> None:
-    body = json.dumps(payload).encode("utf-8")
+    _write_body(handler, status, _JSON_ENCODE(payload).encode("utf-8"))
+
+
+def _write_body(handler: BaseHTTPRequestHandler, status: int, body: bytes) -> None:
     handler.send_response(status)
     handler.send_header("Content-Type", "application/json")
     handler.send_header("Content-Length", str(len(body)))
@@ -767,16 +1140,10 @@ def _write_json(handler: BaseHTTPRequestHandler, status: int, payload: dict[str,
 
 
 def _validate_agent_address(address: str) -> bool:
-    return bool(re.fullmatch(r"claw1[0-9a-z]+", address))
+    return bool(_ADDRESS_RE.fullmatch(address))
 
 
-def _enroll_via_api(
-    conn: sqlite3.Connection,
-    cfg: Config,
-    address: str,
-    signature: str,
-    fee_bps: int,
-) -> dict[str, Any]:
+def _validate_enrollment(address: str, signature: str, fee_bps: int) -> None:
     if not _validate_agent_address(address):
         raise RuntimeError("Invalid Claws address")
     if not (0 <= fee_bps <= 10_000):
@@ -784,6 +1151,10 @@ def _enroll_via_api(
     if not signature:
         raise RuntimeError("Missing stream signature")
 
+
+def _probe_enrollment(cfg: Config, address: str, signature: str, fee_bps: int) -> dict[str, Any]:
+    _validate_enrollment(address, signature, fee_bps)
+
     probe = {
         "ok": True,
         "status_code": 0,
@@ -794,14 +1165,12 @@ def _enroll_via_api(
     if cfg.intake_probe_stream:
         ok, status_code, body, parsed = _post_stream(cfg.stream_url, address, signature)
         end_stream_ms = _extract_end_stream_ms(parsed)
-        reason = "ok" if ok else "error"
-        if not ok and status_code == 403 and "already streaming" in body.lower():
-            reason = "already_streaming"
+        reason = _stream_reason(ok, status_code, body)
 
         # Accept a valid active stream as proof; reject everything else.
         if not ok and not (reason == "already_streaming" and end_stream_ms):
             raise RuntimeError(
-                f"Stream signature probe failed (status={status_code}): {body[:220]}"
+                f"Stream signature probe failed (status={status_code}): {_decode_body(body, 220)}"
             )
 
         probe = {
@@ -809,9 +1178,19 @@ def _enroll_via_api(
             "status_code": status_code,
             "reason": reason,
             "end_stream_ms": end_stream_ms,
-            "response_body": body[:500],
+            "response_body": _decode_body(body, 500),
         }
+    return probe
+
 
+def _enroll_via_api(
+    conn: sqlite3.Connection,
+    cfg: Config,
+    address: str,
+    signature: str,
+    fee_bps: int,
+    probe: dict[str, Any],
+) -> dict[str, Any]:
     enroll_agent(conn, address, signature, fee_bps)
 
     if probe["end_stream_ms"]:
@@ -837,45 +1216,203 @@ def _enroll_via_api(
 
 
 def make_api_handler(
-    db_path: str,
+    pool: ConnectionPool,
     cfg: Config,
     api_token: str | None,
+    wake: threading.Event,
+    probe_executor: ThreadPoolExecutor,
+    scheduler: threading.Thread | None = None,
 ) -> type[BaseHTTPRequestHandler]:
+    # Fixed-shape responses are assembled from pre-encoded fragments; only the
+    # address (JSON-escaped) or timestamp is spliced in per request.
+    health_prefix = b'{"ok":true,"time_ms":'
+    health_suffix = b',"billing_enabled":' + (b"true}" if cfg.billing_enabled else b"false}")
+    address_prefix = b'{"ok":true,"address":'
+    paused_suffix = b',"status":"paused"}'
+    active_suffix = b',"status":"active"}'
+    removed_suffix = b',"removed":true}'
+
+    def address_body(address: str, suffix: bytes) -> bytes:
+        return b"".join((address_prefix, _JSON_ENCODE(address).encode("utf-8"), suffix))
+
+    def write(fn: Any, *args: Any) -> Any:
+        def attempt() -> Any:
+            with pool.writer() as conn:
+                return fn(conn, *args)
+
+        return _with_busy_retry(attempt)
+
+    # Stream probes run off the request thread on the caller's executor; their
+    # outcome is kept in memory per address for GET /probe-status. At most
+    # ENROLL_PROBE_MAX_PENDING may be queued or running at once.
+    probe_slots = threading.BoundedSemaphore(ENROLL_PROBE_MAX_PENDING)
+    probe_status: dict[str, dict[str, Any]] = {}
+    probe_status_lock = threading.Lock()
+
+    def set_probe_status(address: str, status: dict[str, Any]) -> None:
+        with probe_status_lock:
+            probe_status.pop(address, None)
+            probe_status[address] = status
+            if len(probe_status) > PROBE_STATUS_MAX_ENTRIES:
+                del probe_status[next(iter(probe_status))]
+
+    def get_probe_status(address: str) -> dict[str, Any] | None:
+        with probe_status_lock:
+            return probe_status.get(address)
+
+    def probe_and_enroll(address: str, signature: str, fee_bps: int) -> None:
+        try:
+            probe = _probe_enrollment(cfg, address, signature, fee_bps)
+            result = write(_enroll_via_api, cfg, address, signature, fee_bps, probe)
+        except Exception as exc:
+            set_probe_status(address, {"state": "failed", "error": str(exc), "updated_ms": now_ms()})
+            return
+        finally:
+            probe_slots.release()
+        wake.set()
+        set_probe_status(address, {"state": "enrolled", "probe": result["probe"], "updated_ms": now_ms()})
+
+    def post_enroll(handler: BaseHTTPRequestHandler, query: str, payload: dict[str, Any]) -> None:
+        address = str(payload.get("address", "")).strip()
+        signature = str(payload.get("signature", "")).strip()
+        fee_bps = int(payload.get("fee_bps", 500))
+        sync = (parse_qs(query).get("sync") or [""])[0] in ("1", "true")
+        if cfg.intake_probe_stream and not sync:
+            # The agent is only written once its signature has been proven live,
+            # exactly as on the synchronous path.
+            _validate_enrollment(address, signature, fee_bps)
+            if not probe_slots.acquire(blocking=False):
+                _write_json(handler, 503, {"ok": False, "error": "Too many enrollments pending; retry later"})
+                return
+            set_probe_status(address, {"state": "pending", "updated_ms": now_ms()})
+            probe_executor.submit(probe_and_enroll, address, signature, fee_bps)
+            _write_json(
+                handler,
+                202,
+                {"ok": True, "address": address, "fee_bps": fee_bps, "status": "pending", "probe": "pending"},
+            )
+            return
+        probe = _probe_enrollment(cfg, address, signature, fee_bps)
+        result = write(_enroll_via_api, cfg, address, signature, fee_bps, probe)
+        wake.set()
+        _write_json(handler, 200, {"ok": True, **result})
+
+    def post_pause(handler: BaseHTTPRequestHandler, query: str, payload: dict[str, Any]) -> None:
+        address = str(payload.get("address", "")).strip()
+        write(set_status, address, "paused")
+        _write_body(handler, 200, address_body(address, paused_suffix))
+
+    def post_resume(handler: BaseHTTPRequestHandler, query: str, payload: dict[str, Any]) -> None:
+        address = str(payload.get("address", "")).strip()
+        write(set_status, address, "active")
+        wake.set()
+        _write_body(handler, 200, address_body(address, active_suffix))
+
+    def post_remove(handler: BaseHTTPRequestHandler, query: str, payload: dict[str, Any]) -> None:
+        address = str(payload.get("address", "")).strip()
+        write(remove_agent, address)
+        _write_body(handler, 200, address_body(address, removed_suffix))
+
+    def post_tick(handler: BaseHTTPRequestHandler, query: str, payload: dict[str, Any]) -> None:
+        sync = (parse_qs(query).get("sync") or [""])[0] in ("1", "true")
+        if scheduler is not None and scheduler.is_alive() and not sync:
+            # Hand the cycle to the scheduler thread and answer with
+            # whatever it produced last time. If that thread has died, fall
+            # through and run inline so the caller sees the real outcome.
+            wake.set()
+            _write_json(handler, 202, {"ok": True, "queued": True, **_last_tick_result()})
+            return
+        if sync:
+            # The caller asked for a fresh result: wait out a cycle that is
+            # already running, then run one of our own.
+            _TICK_LOCK.acquire()
+        elif not _TICK_LOCK.acquire(blocking=False):
+            # Another cycle is already running; it covers this request too.
+            _write_json(handler, 202, {"ok": True, "in_progress": True, **_last_tick_result()})
+            return
+        try:
+            # Not pool.writer(): the cycle's network calls would stall every
+            # intake mutation. Only its flush transactions contend, in SQLite.
+            with pool.ticker() as conn:
+                result = execute_tick(conn, cfg)
+        finally:
+            _TICK_LOCK.release()
+        _store_tick_result(result)
+        wake.set()
+        _write_json(handler, 200, {"ok": True, **result})
+
+    post_routes = {
+        "/enroll": post_enroll,
+        "/pause": post_pause,
+        "/resume": post_resume,
+        "/remove": post_remove,
+        "/tick": post_tick,
+    }
+
     class IntakeApiHandler(BaseHTTPRequestHandler):
+        # Responses are small single writes; do not let Nagle hold them back.
+        disable_nagle_algorithm = True
+        # Per-recv socket timeout. The server separately enforces a deadline on
+        # receiving the whole request, which is what stops a client trickling
+        # headers or a body from holding a worker slot.
+        timeout = API_CONNECTION_TIMEOUT_S
+
         def _require_auth(self) -> bool:
             if _is_authorized(self, api_token):
                 return True
             _write_json(self, 401, {"ok": False, "error": "Unauthorized"})
             return False
 
+        def handle_one_request(self) -> None:
+            self.server.request_started(self.connection)
+            super().handle_one_request()
+
         def do_GET(self) -> None:  # noqa: N802
+            self.server.request_read(self.connection)
             parsed = urlparse(self.path)
             path = parsed.path
 
             if path == "/health":
-                _write_json(
-                    self,
-                    200,
-                    {"ok": True, "time_ms": now_ms(), "billing_enabled": cfg.billing_enabled},
-                )
+                _write_body(self, 200, b"".join((health_prefix, str(now_ms()).encode("ascii"), health_suffix)))
                 return
 
             if not self._require_auth():
                 return
 
             if path == "/report":
-                with connect_db(db_path) as conn:
+                with pool.reader() as conn:
                     data = collect_report_data(conn)
                 _write_json(self, 200, {"ok": True, "agents": data})
                 return
 
+            if path == "/probe-status":
+                address = (parse_qs(parsed.query).get("address") or [""])[0].strip()
+                if not address:
+                    _write_json(self, 400, {"ok": False, "error": "Missing address query parameter"})
+                    return
+                status = get_probe_status(address)
+                if status is None:
+                    _write_json(self, 404, {"ok": False, "error": "No enrollment probe recorded"})
+                    return
+                _write_json(self, 200, {"ok": True, "address": address, **status})
+                return
+
             if path == "/agent":
                 query = parse_qs(parsed.query)
                 address = (query.get("address") or [""])[0].strip()
                 if not address:
                     _write_json(self, 400, {"ok": False, "error": "Missing address query parameter"})
                     return
-                with connect_db(db_path) as conn:
+                before_raw = (query.get("before_ms") or [""])[0].strip()
+                try:
+                    before_ms = int(before_raw) if before_raw else ATTEMPTS_CURSOR_MAX
+                except ValueError:
+                    before_ms = -1
+                # SQLite binds 64-bit integers only; anything larger overflows at execute time.
+                if not 0 <= before_ms <= ATTEMPTS_CURSOR_MAX:
+                    _write_json(self, 400, {"ok": False, "error": "before_ms must be an integer between 0 and 2^63-1"})
+                    return
+                with pool.reader() as conn:
                     row = conn.execute(
                         "SELECT id FROM agents WHERE address = ?",
                         (address,),
@@ -888,12 +1425,12 @@ def make_api_handler(
                         conn.execute(
                             """
                             SELECT attempted_ms, ok, status_code, reason, end_stream_ms
-                            FROM attempts
-                            WHERE agent_id = ?
+                            FROM attempts INDEXED BY idx_attempts_agent_time
+                            WHERE agent_id = ? AND attempted_ms < ?
                             ORDER BY attempted_ms DESC
                             LIMIT 10
                             """,
-                            (aid,),
+                            (aid, before_ms),
                         )
                     )
                 _write_json(
@@ -912,6 +1449,7 @@ def make_api_handler(
                             }
                             for a in attempts
                         ],
+                        "next_before_ms": int(attempts[-1]["attempted_ms"]) if attempts else None,
                     },
                 )
                 return
@@ -922,52 +1460,27 @@ def make_api_handler(
             if not self._require_auth():
                 return
 
-            path = urlparse(self.path).path
+            parsed = urlparse(self.path)
+            route = post_routes.get(parsed.path)
+            if route is None:
+                _write_json(self, 404, {"ok": False, "error": "Not found"})
+                return
 
             try:
-                payload = _read_json_body(self)
+                length = _content_length(self)
+                if length > API_MAX_BODY_BYTES:
+                    # The unread body makes the connection unusable for another request.
+                    self.close_connection = True
+                    _write_json(self, 413, {"ok": False, "error": f"Body exceeds {API_MAX_BODY_BYTES} bytes"})
+                    return
+                payload = _read_json_body(self, length)
+                self.server.request_read(self.connection)
             except Exception as exc:
                 _write_json(self, 400, {"ok": False, "error": str(exc)})
                 return
 
             try:
-                if path == "/enroll":
-                    address = str(payload.get("address", "")).strip()
-                    signature = str(payload.get("signature", "")).strip()
-                    fee_bps = int(payload.get("fee_bps", 500))
-                    with connect_db(db_path) as conn:
-                        result = _enroll_via_api(conn, cfg, address, signature, fee_bps)
-                    _write_json(self, 200, {"ok": True, **result})
-                    return
-
-                if path == "/pause":
-                    address = str(payload.get("address", "")).strip()
-                    with connect_db(db_path) as conn:
-                        set_status(conn, address, "paused")
-                    _write_json(self, 200, {"ok": True, "address": address, "status": "paused"})
-                    return
-
-                if path == "/resume":
-                    address = str(payload.get("address", "")).strip()
-                    with connect_db(db_path) as conn:
-                        set_status(conn, address, "active")
-                    _write_json(self, 200, {"ok": True, "address": address, "status": "active"})
-                    return
-
-                if path == "/remove":
-                    address = str(payload.get("address", "")).strip()
-                    with connect_db(db_path) as conn:
-                        remove_agent(conn, address)
-                    _write_json(self, 200, {"ok": True, "address": address, "removed": True})
-                    return
-
-                if path == "/tick":
-                    with connect_db(db_path) as conn:
-                        result = execute_tick(conn, cfg)
-                    _write_json(self, 200, {"ok": True, **result})
-                    return
-
-                _write_json(self, 404, {"ok": False, "error": "Not found"})
+                route(self, parsed.query, payload)
             except Exception as exc:
                 _write_json(self, 400, {"ok": False, "error": str(exc)})
 
@@ -977,30 +1490,192 @@ def make_api_handler(
     return IntakeApiHandler
 
 
-def run_scheduler_loop(db_path: str, cfg: Config, stop: threading.Event) -> None:
+class IntakeHttpServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that serves requests on a fixed pool of daemon worker threads.
+
+    Workers are daemon threads, like ThreadingHTTPServer's own per-request
+    threads, so a client mid-request or an inline tick does not hold up exit.
+    """
+
+    # Let the kernel hold bursts in the accept backlog instead of resetting them.
+    request_queue_size = 128
+
+    def __init__(self, server_address: tuple[str, int], handler_class: type[BaseHTTPRequestHandler], workers: int) -> None:
+        self._requests: queue.SimpleQueue[tuple[socket.socket, Any] | None] = queue.SimpleQueue()
+        self._workers = workers
+        # One slot per worker: a connection is only accepted once a worker is
+        # free for it, so nothing queues in-process and open sockets stay bounded.
+        self._slots = threading.BoundedSemaphore(workers)
+        self._closing = False
+        # Sockets still receiving their request, with the monotonic deadline by
+        # which it must have arrived in full. The socket timeout only bounds a
+        # single recv, so a client trickling a byte at a time needs this.
+        self._reading: dict[socket.socket, float] = {}
+        self._reading_lock = threading.Lock()
+        self._watchdog_stop = threading.Event()
+        super().__init__(server_address, handler_class)
+        for i in range(workers):
+            threading.Thread(target=self._serve_requests, name=f"intake-api_{i}", daemon=True).start()
+        threading.Thread(target=self._expire_slow_requests, name="intake-api-deadline", daemon=True).start()
+
+    def server_bind(self) -> None:
+        # Linux only: do not surface a connection to accept() until the client
+        # has sent data, so silent sockets cannot occupy a worker.
+        if hasattr(socket, "TCP_DEFER_ACCEPT"):
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_DEFER_ACCEPT, API_CONNECTION_TIMEOUT_S)
+        super().server_bind()
+
+    def get_request(self) -> tuple[socket.socket, Any]:
+        while not self._slots.acquire(timeout=0.5):
+            if self._closing:
+                raise OSError("server is shutting down")
+        try:
+            return super().get_request()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        self._requests.put((request, client_address))
+
+    def _serve_requests(self) -> None:
+        while True:
+            item = self._requests.get()
+            if item is None:
+                return
+            self.process_request_thread(*item)
+
+    def request_started(self, request: socket.socket) -> None:
+        """Called by the handler before it reads each request on a connection."""
+        with self._reading_lock:
+            self._reading[request] = time.monotonic() + API_CONNECTION_TIMEOUT_S
+
+    def request_read(self, request: socket.socket) -> None:
+        """Called by the handler once the request line, headers and body are in."""
+        with self._reading_lock:
+            self._reading.pop(request, None)
+
+    def _expire_slow_requests(self) -> None:
+        while not self._watchdog_stop.wait(0.25):
+            now = time.monotonic()
+            with self._reading_lock:
+                expired = [sock for sock, deadline in self._reading.items() if deadline <= now]
+                for sock in expired:
+                    del self._reading[sock]
+            for sock in expired:
+                # Ends the blocked recv with EOF; the handler then gives up on
+                # the request and the worker is freed.
+                try:
+                    sock.shutdown(socket.SHUT_RD)
+                except OSError:
+                    pass
+
+    def shutdown_request(self, request: Any) -> None:
+        self.request_read(request)
+        try:
+            super().shutdown_request(request)
+        finally:
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        self._closing = True
+        super().shutdown()
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._watchdog_stop.set()
+        for _ in range(self._workers):
+            self._requests.put(None)
+
+
+# Held for the duration of a cycle so the scheduler thread and /tick never
+# run execute_tick concurrently.
+_TICK_LOCK = threading.Lock()
+_LAST_TICK_LOCK = threading.Lock()
+_LAST_TICK_RESULT: dict[str, Any] = {}
+
+
+def _store_tick_result(result: dict[str, Any]) -> None:
+    with _LAST_TICK_LOCK:
+        _LAST_TICK_RESULT.clear()
+        _LAST_TICK_RESULT.update(result)
+
+
+def _store_tick_error(message: str) -> None:
+    # Keep the last good stats but flag that the most recent cycle failed.
+    with _LAST_TICK_LOCK:
+        _LAST_TICK_RESULT["tick_error"] = message
+
+
+def _last_tick_result() -> dict[str, Any]:
+    with _LAST_TICK_LOCK:
+        return dict(_LAST_TICK_RESULT)
+
+
+def _next_deadline(deadline: float, poll: float) -> float:
+    # Keep a fixed cadence regardless of how long the tick took, but after an
+    # overrun start afresh instead of firing the missed ticks back to back.
+    deadline += poll
+    now = time.monotonic()
+    return deadline if deadline > now else now
+
+
+def run_scheduler_loop(db_path: str, cfg: Config, stop: threading.Event, wake: threading.Event) -> None:
     print(
         f"Scheduler loop started: poll={cfg.poll_interval_seconds}s lead={cfg.lead_seconds}s "
         f"jitter={cfg.jitter_seconds}s reward/window={cfg.reward_per_window} billing={cfg.billing_enabled}"
     )
-    conn = connect_db(db_path)
-    init_db(conn)
+    # run_api_server applies the schema through the pool writer before this
+    # thread starts, so the scheduler only needs its own connection.
+    conn = connect_db(db_path, cfg.sqlite_busy_timeout_ms)
+    poll = cfg.poll_interval_seconds
+    deadline = time.monotonic()
     try:
         while not stop.is_set():
-            result = execute_tick(conn, cfg)
-            stream_stats = result["stream"]
-            bill_stats = result["billing"]
-            if stream_stats["processed"] > 0 or bill_stats["billing_candidates"] > 0:
-                print(
-                    f"{datetime.now(tz=timezone.utc).isoformat()} "
-                    f"stream processed={stream_stats['processed']} ok={stream_stats['ok']} fail={stream_stats['fail']} "
-                    f"usage+={stream_stats['usage_windows_added']} "
-                    f"bill cand={bill_stats['billing_candidates']} ok={bill_stats['billing_ok']} fail={bill_stats['billing_fail']}"
-                )
-            if result["epoch_error"]:
-                print(f"{datetime.now(tz=timezone.utc).isoformat()} epoch-fetch-error: {result['epoch_error']}")
-            stop.wait(cfg.poll_interval_seconds)
+            try:
+                with _TICK_LOCK:
+                    result = execute_tick(conn, cfg)
+            except Exception as exc:
+                # One bad cycle must not kill the thread; /tick would otherwise
+                # keep serving a stale result with nobody running ticks.
+                message = f"{type(exc).__name__}: {exc}"
+                _store_tick_error(message)
+                sys.stderr.write(f"{datetime.now(tz=timezone.utc).isoformat()} tick-error: {message}\n")
+                result = None
+            if result is not None:
+                _store_tick_result(result)
+                _log_tick_result(result)
+            # Only a tick that reached the deadline moves it on. Ticks started
+            # early by wake leave the periodic schedule alone, so a burst of API
+            # mutations cannot postpone renewals.
+            if time.monotonic() >= deadline:
+                deadline = _next_deadline(deadline, poll)
+            # API mutations set wake so new or resumed agents are picked up
+            # without waiting out the poll interval.
+            if wake.wait(max(0.0, deadline - time.monotonic())):
+                wake.clear()
     finally:
-        conn.close()
+        close_db(conn)
+
+
+def _log_tick_result(result: dict[str, Any]) -> None:
+    stream_stats = result["stream"]
+    bill_stats = result["billing"]
+    epoch_error = result["epoch_error"]
+    # Idle ticks skip timestamp and message formatting entirely.
+    if stream_stats["processed"] or bill_stats["billing_candidates"] or epoch_error:
+        ts = datetime.now(tz=timezone.utc).isoformat()
+        lines = []
+        if stream_stats["processed"] or bill_stats["billing_candidates"]:
+            lines.append(
+                f"{ts} stream processed={stream_stats['processed']} ok={stream_stats['ok']} "
+                f"fail={stream_stats['fail']} usage+={stream_stats['usage_windows_added']} "
+                f"bill cand={bill_stats['billing_candidates']} ok={bill_stats['billing_ok']} "
+                f"fail={bill_stats['billing_fail']}\n"
+            )
+        if epoch_error:
+            lines.append(f"{ts} epoch-fetch-error: {epoch_error}\n")
+        sys.stdout.write("".join(lines))
 
 
 def run_api_server(
@@ -1010,19 +1685,36 @@ def run_api_server(
     port: int,
     api_token: str | None,
     with_scheduler: bool,
+    pool_size: int,
+    workers: int = DEFAULT_API_WORKERS,
 ) -> None:
-    handler_class = make_api_handler(db_path=db_path, cfg=cfg, api_token=api_token)
-    server = ThreadingHTTPServer((host, port), handler_class)
-    server.daemon_threads = True
+    pool = ConnectionPool(db_path, readers=pool_size, busy_timeout_ms=cfg.sqlite_busy_timeout_ms)
+    with pool.writer() as conn:
+        init_db(conn)
+        conn.execute("ANALYZE")
 
     scheduler_stop = threading.Event()
+    scheduler_wake = threading.Event()
     scheduler_thread = None
     if with_scheduler:
         scheduler_thread = threading.Thread(
             target=run_scheduler_loop,
-            args=(db_path, cfg, scheduler_stop),
+            args=(db_path, cfg, scheduler_stop, scheduler_wake),
             daemon=True,
         )
+    probe_executor = ThreadPoolExecutor(max_workers=ENROLL_PROBE_WORKERS, thread_name_prefix="enroll-probe")
+    handler_class = make_api_handler(
+        pool=pool,
+        cfg=cfg,
+        api_token=api_token,
+        wake=scheduler_wake,
+        probe_executor=probe_executor,
+        scheduler=scheduler_thread,
+    )
+    # Workers mostly wait on sockets, so they are sized independently of the
+    # reader connections; a worker briefly blocks if all readers are checked out.
+    server = IntakeHttpServer((host, port), handler_class, workers=workers)
+    if scheduler_thread is not None:
         scheduler_thread.start()
 
     auth_msg = "disabled" if not api_token else "enabled"
@@ -1039,8 +1731,13 @@ def run_api_server(
         server.shutdown()
         server.server_close()
         scheduler_stop.set()
+        scheduler_wake.set()
         if scheduler_thread:
             scheduler_thread.join(timeout=3)
+        # Queued probes are dropped; running ones finish their write before the
+        # pool goes away.
+        probe_executor.shutdown(wait=True, cancel_futures=True)
+        pool.close()
 
 
 def run_forever(conn: sqlite3.Connection, cfg: Config) -> None:
@@ -1050,12 +1747,16 @@ def run_forever(conn: sqlite3.Connection, cfg: Config) -> None:
         f"reward/window={cfg.reward_per_window} billing={cfg.billing_enabled}"
     )
 
+    poll = cfg.poll_interval_seconds
+    billing_enabled = cfg.billing_enabled
+    epoch_api_url = cfg.epoch_api_url
+    deadline = time.monotonic()
     try:
         while True:
             chain_epoch = None
-            if cfg.billing_enabled:
+            if billing_enabled:
                 try:
-                    chain_epoch = get_chain_epoch(cfg.epoch_api_url)
+                    chain_epoch = get_chain_epoch(epoch_api_url)
                 except Exception as exc:
                     print(f"{datetime.now(tz=timezone.utc).isoformat()} epoch-fetch-error: {exc}")
 
@@ -1070,14 +1771,48 @@ def run_forever(conn: sqlite3.Connection, cfg: Config) -> None:
                     f"bill cand={bill_stats['billing_candidates']} ok={bill_stats['billing_ok']} fail={bill_stats['billing_fail']}"
                 )
 
-            time.sleep(cfg.poll_interval_seconds)
+            deadline = _next_deadline(deadline, poll)
+            time.sleep(max(0.0, deadline - time.monotonic()))
     except KeyboardInterrupt:
         print("\nStopped.")
 
 
-def parse_args() -> argparse.Namespace:
+def _add_runtime_args(sp: argparse.ArgumentParser) -> None:
+    sp.add_argument("--lead-seconds", type=int, default=360)
+    sp.add_argument("--jitter-seconds", type=int, default=20)
+    sp.add_argument("--reward-per-window", type=float, default=1.0)
+    sp.add_argument("--stream-url", default=STREAM_URL)
+    sp.add_argument(
+        "--intake-no-probe-stream",
+        action="store_true",
+        help="Skip stream signature probe during API /enroll (not recommended).",
+    )
+
+    sp.add_argument("--billing-enabled", action="store_true")
+    sp.add_argument("--escrow-contract", default="")
+    sp.add_argument("--operator-pem", default="")
+    sp.add_argument("--epoch-api-url", default=DEFAULT_API_URL)
+    sp.add_argument("--billing-proxy", default=DEFAULT_API_URL)
+    sp.add_argument("--billing-chain", default="C")
+    sp.add_argument("--billing-gas-limit", type=int, default=25_000_000)
+    sp.add_argument("--billing-gas-price", type=int, default=20_000_000_000_000)
+    sp.add_argument(
+        "--billing-workers",
+        type=int,
+        default=1,
+        help="Concurrent billEpoch submissions (all share the operator nonce; keep 1 unless clawpy handles that).",
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Stream Agency daemon")
     p.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite DB path")
+    p.add_argument(
+        "--sqlite-busy-timeout-ms",
+        type=int,
+        default=DEFAULT_SQLITE_BUSY_TIMEOUT_MS,
+        help="How long SQLite waits on a locked database before failing",
+    )
 
     sub = p.add_subparsers(dest="command", required=True)
 
@@ -1101,32 +1836,12 @@ def parse_args() -> argparse.Namespace:
     sp_remove = sub.add_parser("remove", help="Delete an agent and all local records")
     sp_remove.add_argument("--address", required=True)
 
-    def add_runtime_args(sp: argparse.ArgumentParser) -> None:
-        sp.add_argument("--lead-seconds", type=int, default=360)
-        sp.add_argument("--jitter-seconds", type=int, default=20)
-        sp.add_argument("--reward-per-window", type=float, default=1.0)
-        sp.add_argument("--stream-url", default=STREAM_URL)
-        sp.add_argument(
-            "--intake-no-probe-stream",
-            action="store_true",
-            help="Skip stream signature probe during API /enroll (not recommended).",
-        )
-
-        sp.add_argument("--billing-enabled", action="store_true")
-        sp.add_argument("--escrow-contract", default="")
-        sp.add_argument("--operator-pem", default="")
-        sp.add_argument("--epoch-api-url", default=DEFAULT_API_URL)
-        sp.add_argument("--billing-proxy", default=DEFAULT_API_URL)
-        sp.add_argument("--billing-chain", default="C")
-        sp.add_argument("--billing-gas-limit", type=int, default=25_000_000)
-        sp.add_argument("--billing-gas-price", type=int, default=20_000_000_000_000)
-
     sp_tick = sub.add_parser("tick", help="Run one scheduling cycle (+ optional auto billing)")
-    add_runtime_args(sp_tick)
+    _add_runtime_args(sp_tick)
 
     sp_run = sub.add_parser("run", help="Run continuous scheduler loop (+ optional auto billing)")
     sp_run.add_argument("--poll-seconds", type=int, default=20)
-    add_runtime_args(sp_run)
+    _add_runtime_args(sp_run)
 
     sp_api = sub.add_parser("api", help="Run intake HTTP API server")
     sp_api.add_argument("--poll-seconds", type=int, default=20)
@@ -1137,12 +1852,24 @@ def parse_args() -> argparse.Namespace:
         default="",
         help="Optional bearer/API key token for all endpoints except /health",
     )
+    sp_api.add_argument(
+        "--api-pool-size",
+        type=int,
+        default=os.cpu_count() or 4,
+        help="Read-only SQLite connections for API read endpoints (default: CPU count)",
+    )
+    sp_api.add_argument(
+        "--api-workers",
+        type=int,
+        default=DEFAULT_API_WORKERS,
+        help="Request worker threads, and the cap on connections being served at once",
+    )
     sp_api.add_argument(
         "--with-scheduler",
         action="store_true",
         help="Run scheduler loop in-process alongside the API server",
     )
-    add_runtime_args(sp_api)
+    _add_runtime_args(sp_api)
 
     sub.add_parser("report", help="Show enrolled agents and local usage summary")
 
@@ -1153,12 +1880,21 @@ def parse_args() -> argparse.Namespace:
     sp_ba = sub.add_parser("billing-attempts", help="Show recent billEpoch attempt history")
     sp_ba.add_argument("--limit", type=int, default=20)
 
-    return p.parse_args()
+    return p
+
+
+_PARSER = _build_parser()
+
+
+def parse_args() -> argparse.Namespace:
+    return _PARSER.parse_args()
 
 
 def _build_config(args: argparse.Namespace) -> Config:
     if args.billing_enabled and (not args.escrow_contract or not args.operator_pem):
         raise RuntimeError("--billing-enabled requires --escrow-contract and --operator-pem")
+    if args.billing_workers < 1:
+        raise RuntimeError("--billing-workers must be at least 1")
 
     return Config(
         lead_seconds=args.lead_seconds,
@@ -1173,62 +1909,85 @@ def _build_config(args: argparse.Namespace) -> Config:
         billing_chain=args.billing_chain,
         billing_gas_limit=args.billing_gas_limit,
         billing_gas_price=args.billing_gas_price,
+        billing_workers=args.billing_workers,
         epoch_api_url=args.epoch_api_url,
         intake_probe_stream=not getattr(args, "intake_no_probe_stream", False),
+        sqlite_busy_timeout_ms=args.sqlite_busy_timeout_ms,
     )
 
 
 def main() -> int:
     args = parse_args()
     db_path = str(Path(args.db))
+    busy_timeout_ms = args.sqlite_busy_timeout_ms
 
-    conn = connect_db(db_path)
-    init_db(conn)
-
+    # Each branch opens its own connection; only commands that may write to a
+    # fresh database run the schema DDL.
     if args.command == "init-db":
+        with open_db(db_path, busy_timeout_ms) as conn:
+            init_db(conn)
         print(f"DB ready: {db_path}")
         return 0
 
     if args.command == "enroll":
         if not (0 <= args.fee_bps <= 10_000):
             raise RuntimeError("fee-bps must be between 0 and 10000")
-        enroll_agent(conn, args.address, args.signature, args.fee_bps)
+        with open_db(db_path, busy_timeout_ms) as conn:
+            init_db(conn)
+            enroll_agent(conn, args.address, args.signature, args.fee_bps)
         print(f"Enrolled: {args.address}")
         return 0
 
     if args.command == "enroll-from-pem":
         if not (0 <= args.fee_bps <= 10_000):
             raise RuntimeError("fee-bps must be between 0 and 10000")
-        address = enroll_from_pem(conn, args.pem, args.fee_bps)
+        with open_db(db_path, busy_timeout_ms) as conn:
+            init_db(conn)
+            address = enroll_from_pem(conn, args.pem, args.fee_bps)
         print(f"Enrolled from PEM: {address}")
         return 0
 
     if args.command == "pause":
-        set_status(conn, args.address, "paused")
+        with open_db(db_path, busy_timeout_ms) as conn:
+            set_status(conn, args.address, "paused")
         print(f"Paused: {args.address}")
         return 0
 
     if args.command == "resume":
-        set_status(conn, args.address, "active")
+        with open_db(db_path, busy_timeout_ms) as conn:
+            set_status(conn, args.address, "active")
         print(f"Resumed: {args.address}")
         return 0
 
     if args.command == "remove":
-        remove_agent(conn, args.address)
+        with open_db(db_path, busy_timeout_ms) as conn:
+            remove_agent(conn, args.address)
         print(f"Removed: {args.address}")
         return 0
 
     if args.command in ("tick", "run"):
         cfg = _build_config(args)
-        if args.command == "tick":
-            print(json.dumps(execute_tick(conn, cfg), indent=2))
-            return 0
-
-        run_forever(conn, cfg)
+        with open_db(db_path, busy_timeout_ms) as conn:
+            init_db(conn)
+            if args.command == "tick":
+                result = execute_tick(conn, cfg)
+                # Indent for people; pipes and cron logs get one compact line.
+                if sys.stdout.isatty():
+                    sys.stdout.write(json.dumps(result, indent=2) + "\n")
+                else:
+                    sys.stdout.write(_JSON_ENCODE(result) + "\n")
+                return 0
+
+            conn.execute("ANALYZE")
+            run_forever(conn, cfg)
         return 0
 
     if args.command == "api":
         cfg = _build_config(args)
+        if args.api_pool_size < 1:
+            raise RuntimeError("--api-pool-size must be at least 1")
+        if args.api_workers < 1:
+            raise RuntimeError("--api-workers must be at least 1")
         run_api_server(
             db_path=db_path,
             cfg=cfg,
@@ -1236,19 +1995,24 @@ def main() -> int:
             port=args.api_port,
             api_token=args.api_token or None,
             with_scheduler=args.with_scheduler,
+            pool_size=args.api_pool_size,
+            workers=args.api_workers,
         )
         return 0
 
     if args.command == "report":
-        print_report(conn)
+        with open_db(db_path, busy_timeout_ms) as conn:
+            print_report(conn)
         return 0
 
     if args.command == "attempts":
-        print_attempts(conn, args.address, args.limit)
+        with open_db(db_path, busy_timeout_ms) as conn:
+            print_attempts(conn, args.address, args.limit)
         return 0
 
     if args.command == "billing-attempts":
-        print_billing_attempts(conn, args.limit)
+        with open_db(db_path, busy_timeout_ms) as conn:
+            print_billing_attempts(conn, args.limit)
         return 0
 
     raise RuntimeError(f"Unknown command: {args.command}")
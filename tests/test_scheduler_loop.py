@@ -0,0 +1,89 @@
+import dataclasses
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import stream_agency  # noqa: E402
+
+IDLE_RESULT = {
+    "stream": {"processed": 0, "ok": 0, "fail": 0, "usage_windows_added": 0},
+    "billing": {"billing_candidates": 0, "billing_ok": 0, "billing_fail": 0},
+    "chain_epoch": None,
+    "epoch_error": None,
+}
+
+
+class RunSchedulerLoopTest(unittest.TestCase):
+    def run_loop(self, poll: float, duration: float, wake_at: list[float]) -> list[float]:
+        args = stream_agency._PARSER.parse_args(["api"])
+        cfg = dataclasses.replace(stream_agency._build_config(args), poll_interval_seconds=poll)
+        ticks: list[float] = []
+        start = time.monotonic()
+
+        def fake_tick(conn: object, cfg: object) -> dict:
+            ticks.append(time.monotonic() - start)
+            return IDLE_RESULT
+
+        stop = threading.Event()
+        wake = threading.Event()
+        with mock.patch.object(stream_agency, "execute_tick", fake_tick):
+            thread = threading.Thread(
+                target=stream_agency.run_scheduler_loop,
+                args=(":memory:", cfg, stop, wake),
+                daemon=True,
+            )
+            thread.start()
+            for at in wake_at:
+                time.sleep(max(0.0, start + at - time.monotonic()))
+                wake.set()
+            time.sleep(max(0.0, start + duration - time.monotonic()))
+            stop.set()
+            wake.set()
+            thread.join(timeout=2)
+        self.assertFalse(thread.is_alive())
+        return ticks
+
+    def test_wakes_do_not_postpone_periodic_ticks(self) -> None:
+        # Eight wakes 25ms apart inside the first poll interval.
+        ticks = self.run_loop(poll=0.2, duration=1.25, wake_at=[0.02 + 0.025 * i for i in range(8)])
+
+        self.assertGreater(len([t for t in ticks if t < 0.2]), 1, ticks)
+        # Periodic ticks must keep firing at ~0.4, 0.6, 0.8, 1.0 after the burst.
+        self.assertGreaterEqual(len([t for t in ticks if 0.3 < t < 1.25]), 3, ticks)
+
+    def test_failing_tick_does_not_stop_the_loop(self) -> None:
+        calls: list[int] = []
+
+        def flaky(conn: object, cfg: object) -> dict:
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return IDLE_RESULT
+
+        args = stream_agency._PARSER.parse_args(["api"])
+        cfg = dataclasses.replace(stream_agency._build_config(args), poll_interval_seconds=0.05)
+        stop = threading.Event()
+        wake = threading.Event()
+        with mock.patch.object(stream_agency, "execute_tick", flaky), mock.patch("sys.stderr"):
+            thread = threading.Thread(
+                target=stream_agency.run_scheduler_loop,
+                args=(":memory:", cfg, stop, wake),
+                daemon=True,
+            )
+            thread.start()
+            time.sleep(0.3)
+            self.assertTrue(thread.is_alive())
+            stop.set()
+            wake.set()
+            thread.join(timeout=2)
+        self.assertGreater(len(calls), 1)
+        self.assertNotIn("tick_error", stream_agency._last_tick_result())
+
+
+if __name__ == "__main__":
+    unittest.main()